@@ -2,22 +2,49 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
 import jwt
 import os
+import re
 
 SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "supercharge-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Tuned for roughly 50ms per hash on typical server hardware
+pwd_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
 security = HTTPBearer()
 
+# bcrypt 4.1 panics (a BaseException) instead of raising on truncated hashes,
+# so legacy hashes are shape-checked before they reach checkpw
+BCRYPT_HASH_RE = re.compile(r"\$2[abxy]\$\d{2}\$[./A-Za-z0-9]{53}")
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    # Accounts created before the switch to argon2 still carry bcrypt hashes
+    if hashed_password.startswith("$2"):
+        if not BCRYPT_HASH_RE.fullmatch(hashed_password):
+            return False
+        try:
+            return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        except ValueError:
+            return False
+    try:
+        return pwd_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def verify_and_update(plain_password: str, hashed_password: str) -> tuple:
+    """Verify a password, also returning a new hash if the stored one is bcrypt or outdated"""
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if hashed_password.startswith("$2") or pwd_hasher.check_needs_rehash(hashed_password):
+        return True, get_password_hash(plain_password)
+    return True, None
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return pwd_hasher.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -1,18 +1,27 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
 import os
+import asyncio
 import logging
+import hashlib
+import math
+import orjson
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from typing import List, Optional, Dict
 import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from auth import (
     get_password_hash,
-    verify_password,
+    verify_and_update,
     create_access_token,
     get_current_user,
     get_current_user_optional,
@@ -27,11 +36,175 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+_UTC = timezone.utc
+# BSON dates decode as aware UTC datetimes so responses carry an explicit offset
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=200,
+    minPoolSize=20,
+    maxIdleTimeMS=60000,
+    waitQueueTimeoutMS=5000,
+    serverSelectionTimeoutMS=5000,
+    compressors="zstd",
+    tz_aware=True,
+    tzinfo=_UTC
+)
 db = client[os.environ['DB_NAME']]
 
+# Password hashing is CPU-bound, so it runs outside the event loop
+PWD_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+def utcnow() -> datetime:
+    return datetime.now(_UTC)
+
+# Lookup tables built once from the static career path data
+PATHS_BY_ID = {p["id"]: p for p in ENHANCED_CAREER_PATHS}
+MILESTONE_COUNT_BY_PATH = {p["id"]: len(p["milestones"]) for p in ENHANCED_CAREER_PATHS}
+TOTAL_DAYS_BY_PATH = {
+    p["id"]: sum(m["estimated_days"] for m in p["milestones"])
+    for p in ENHANCED_CAREER_PATHS
+}
+ACHIEVEMENT_THRESHOLDS = {
+    p["id"]: {"total": len(p["milestones"]), "halfway": math.ceil(len(p["milestones"]) / 2)}
+    for p in ENHANCED_CAREER_PATHS
+}
+# Completed milestones are stored as a bitmask; bit i is the path's i-th milestone,
+# so new milestones must only ever be appended to a path
+MILESTONE_IDS_BY_PATH = {p["id"]: [m["id"] for m in p["milestones"]] for p in ENHANCED_CAREER_PATHS}
+MILESTONE_BITS_BY_PATH = {
+    path_id: {milestone_id: bit for bit, milestone_id in enumerate(ids)}
+    for path_id, ids in MILESTONE_IDS_BY_PATH.items()
+}
+QUESTIONS_BY_ID = {q["id"]: q for q in SKILL_ASSESSMENT_QUESTIONS}
+
+ACHIEVEMENTS = [
+    {
+        "id": "first_step",
+        "name": "First Step",
+        "description": "Complete your first milestone",
+        "icon": "🎯",
+        "color": "#10B981"
+    },
+    {
+        "id": "halfway_hero",
+        "name": "Halfway Hero",
+        "description": "Complete 50% of a career path",
+        "icon": "🚀",
+        "color": "#3B82F6"
+    },
+    {
+        "id": "path_master",
+        "name": "Path Master",
+        "description": "Complete an entire career path",
+        "icon": "👑",
+        "color": "#F59E0B"
+    },
+    {
+        "id": "speed_demon",
+        "name": "Speed Demon",
+        "description": "Complete a path in record time",
+        "icon": "⚡",
+        "color": "#EF4444"
+    },
+    {
+        "id": "multi_path",
+        "name": "Multi-Path Master",
+        "description": "Complete 3 different career paths",
+        "icon": "🌟",
+        "color": "#8B5CF6"
+    }
+]
+
+def _count_completed(mask: int) -> int:
+    return bin(mask).count("1")
+
+def _expand_progress(progress: dict) -> dict:
+    """Replace the stored completed_mask with the completed_milestones list clients expect"""
+    mask = progress.pop("completed_mask", 0)
+    ids = MILESTONE_IDS_BY_PATH.get(progress["career_path_id"], [])
+    progress["completed_milestones"] = [m for bit, m in enumerate(ids) if mask & (1 << bit)]
+    return progress
+
+def _mask_count_expr(total: int) -> dict:
+    """Aggregation expression counting the set bits of completed_mask"""
+    return {"$sum": [
+        {"$mod": [{"$floor": {"$divide": ["$completed_mask", 1 << bit]}}, 2]}
+        for bit in range(total)
+    ]}
+
+def _progress_update_pipeline(path_id: str, changes: Dict[int, bool]) -> list:
+    """Pipeline that sets or clears milestone bits and re-evaluates achievements"""
+    mask = {"$ifNull": ["$completed_mask", 0]}
+    flags = [1 << bit for bit in changes]
+    set_flags = sum(1 << bit for bit, completed in changes.items() if completed)
+    # Clear every touched bit that is currently set, then set the completed ones
+    touched = {"$add": [
+        {"$multiply": [{"$mod": [{"$floor": {"$divide": [mask, flag]}}, 2]}, flag]}
+        for flag in flags
+    ]}
+    pipeline = [{
+        "$set": {
+            "id": {"$ifNull": ["$id", uuid.uuid4().hex]},
+            # $divide/$floor/$mod yield doubles, so cast back to keep the mask an integer
+            "completed_mask": {"$toLong": {"$add": [{"$subtract": [mask, touched]}, set_flags]}},
+            "achievements": {"$ifNull": ["$achievements", []]},
+            "updated_at": utcnow()
+        }
+    }]
+    
+    if set_flags:
+        thresh = ACHIEVEMENT_THRESHOLDS[path_id]
+        milestone_count = _mask_count_expr(thresh["total"])
+        pipeline.append({
+            "$set": {
+                "achievements": {
+                    "$setUnion": [
+                        "$achievements",
+                        # First milestone achievement
+                        {"$cond": [{"$gte": [milestone_count, 1]}, ["first_step"], []]},
+                        # Halfway achievement
+                        {"$cond": [{"$gte": [milestone_count, thresh["halfway"]]}, ["halfway_hero"], []]},
+                        # Completion achievement
+                        {"$cond": [{"$eq": [milestone_count, thresh["total"]]}, ["path_master"], []]}
+                    ]
+                }
+            }
+        })
+        
+        # Speed achievements (if completed in estimated time or less)
+        # This is simplified - in production you'd track actual time
+    
+    return pipeline
+
+# Static payloads are encoded once and served with an ETag
+def _encode_static(payload) -> tuple:
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.sha256(body).hexdigest()}"'
+
+_CAREER_PATHS_BYTES, _CAREER_PATHS_ETAG = _encode_static(ENHANCED_CAREER_PATHS)
+_QUIZ_QUESTIONS_BYTES, _QUIZ_QUESTIONS_ETAG = _encode_static(SKILL_ASSESSMENT_QUESTIONS)
+_ACHIEVEMENTS_BYTES, _ACHIEVEMENTS_ETAG = _encode_static({"achievements": ACHIEVEMENTS})
+
+GZIP_MINIMUM_SIZE = 1000
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    # GZipMiddleware keeps our ETag, so the compressed representation gets its own tag
+    gzipped = len(body) >= GZIP_MINIMUM_SIZE and "gzip" in request.headers.get("accept-encoding", "")
+    if gzipped:
+        etag = f'{etag[:-1]}-gzip"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if_none_match = request.headers.get("if-none-match", "")
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    # GZipMiddleware adds Vary itself, but only to the bodies it compresses
+    if if_none_match.strip() == "*" or etag in tags:
+        return Response(status_code=304, headers={**headers, "Vary": "Accept-Encoding"})
+    if not gzipped:
+        headers["Vary"] = "Accept-Encoding"
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # Create the main app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # ================== MODELS ==================
@@ -42,7 +215,7 @@ class Resource(BaseModel):
     type: str  # video, article, course
 
 class Milestone(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str
     description: str
     order: int
@@ -51,27 +224,30 @@ class Milestone(BaseModel):
 
 class CareerPath(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: str
     icon: str
     color: str
     milestones: List[Milestone]
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
 
 class UserProgress(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     career_path_id: str
     completed_milestones: List[str] = []
     achievements: List[str] = []
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=utcnow)
 
 class ProgressUpdate(BaseModel):
     milestone_id: str
     completed: bool
 
+class BulkProgressUpdate(BaseModel):
+    milestones: List[ProgressUpdate]
+
 # Auth Models
 class UserSignup(BaseModel):
     email: EmailStr
@@ -84,11 +260,11 @@ class UserLogin(BaseModel):
 
 class User(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     email: EmailStr
     name: str
     hashed_password: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
     quiz_completed: bool = False
     recommended_paths: List[str] = []
 
@@ -113,6 +289,10 @@ class CertificateRequest(BaseModel):
 class ShareProgress(BaseModel):
     path_id: str
 
+# Static data is validated once at import and served as plain dicts afterwards
+for _path in ENHANCED_CAREER_PATHS:
+    CareerPath.model_validate(_path)
+
 # ================== ROUTES ==================
 
 # --- Auth Routes ---
@@ -120,23 +300,28 @@ class ShareProgress(BaseModel):
 async def signup(user_data: UserSignup):
     """Register a new user"""
     # Check if user exists
-    existing_user = await db.users.find_one({"email": user_data.email})
+    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    loop = asyncio.get_running_loop()
+    hashed_password = await loop.run_in_executor(PWD_POOL, get_password_hash, user_data.password)
     new_user = {
-        "id": str(uuid.uuid4()),
+        "id": uuid.uuid4().hex,
         "email": user_data.email,
         "name": user_data.name,
         "hashed_password": hashed_password,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utcnow(),
         "quiz_completed": False,
         "recommended_paths": []
     }
     
-    await db.users.insert_one(new_user)
+    try:
+        await db.users.insert_one(new_user)
+    except DuplicateKeyError:
+        # A concurrent signup with the same email won the race
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create access token
     access_token = create_access_token(data={"sub": new_user["id"], "email": new_user["email"]})
@@ -155,12 +340,25 @@ async def signup(user_data: UserSignup):
 async def login(credentials: UserLogin):
     """Login user"""
     user = await db.users.find_one({"email": credentials.email})
-    if not user or not verify_password(credentials.password, user["hashed_password"]):
+    password_ok = False
+    if user:
+        loop = asyncio.get_running_loop()
+        password_ok, new_hash = await loop.run_in_executor(
+            PWD_POOL, verify_and_update, credentials.password, user["hashed_password"]
+        )
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
+    # Move legacy bcrypt users to argon2 now that the plaintext is known
+    if new_hash:
+        await db.users.update_one(
+            {"id": user["id"], "hashed_password": user["hashed_password"]},
+            {"$set": {"hashed_password": new_hash}}
+        )
+    
     # Create access token
     access_token = create_access_token(data={"sub": user["id"], "email": user["email"]})
     
@@ -189,30 +387,31 @@ async def get_me(current_user: dict = Depends(get_current_user)):
 async def root():
     return {"message": "SUPERCHARGE API - Enhanced Career Roadmap Platform"}
 
-@api_router.get("/career-paths", response_model=List[CareerPath])
-async def get_career_paths():
+@api_router.get("/career-paths")
+async def get_career_paths(request: Request):
     """Get all career paths with enhanced data"""
-    return ENHANCED_CAREER_PATHS
+    return _static_response(request, _CAREER_PATHS_BYTES, _CAREER_PATHS_ETAG)
 
-@api_router.get("/career-paths/{path_id}", response_model=CareerPath)
+@api_router.get("/career-paths/{path_id}")
 async def get_career_path(path_id: str):
     """Get a specific career path"""
-    for path in ENHANCED_CAREER_PATHS:
-        if path["id"] == path_id:
-            return path
+    path = PATHS_BY_ID.get(path_id)
+    if path:
+        return path
     raise HTTPException(status_code=404, detail="Career path not found")
 
 # --- Progress Routes ---
-@api_router.get("/progress/{user_id}", response_model=List[UserProgress])
-async def get_user_progress(user_id: str):
-    """Get user's progress across all career paths"""
-    progress_list = await db.user_progress.find({"user_id": user_id}, {"_id": 0}).to_list(100)
-    
-    for progress in progress_list:
-        if isinstance(progress.get('updated_at'), str):
-            progress['updated_at'] = datetime.fromisoformat(progress['updated_at'])
-    
-    return progress_list
+@api_router.get("/progress/{user_id}")
+async def get_user_progress(
+    user_id: str,
+    limit: int = Query(100, ge=1, le=100),
+    cursor: int = Query(0, ge=0)
+):
+    """Get user's progress across all career paths, most recently updated first"""
+    progress_list = await db.user_progress.find(
+        {"user_id": user_id}, {"_id": 0}
+    ).sort([("updated_at", -1), ("_id", -1)]).skip(cursor).limit(limit).to_list(limit)
+    return [_expand_progress(progress) for progress in progress_list]
 
 @api_router.get("/progress/{user_id}/{path_id}")
 async def get_path_progress(user_id: str, path_id: str):
@@ -229,106 +428,79 @@ async def get_path_progress(user_id: str, path_id: str):
             "career_path_id": path_id,
             "completed_milestones": [],
             "achievements": [],
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "updated_at": utcnow()
         }
     
-    if isinstance(progress.get('updated_at'), str):
-        progress['updated_at'] = datetime.fromisoformat(progress['updated_at'])
-    
-    return progress
+    return _expand_progress(progress)
 
 @api_router.post("/progress/{user_id}/{path_id}")
 async def update_progress(user_id: str, path_id: str, update: ProgressUpdate):
     """Update milestone completion status with achievement tracking"""
-    # Find existing progress
-    existing = await db.user_progress.find_one(
-        {"user_id": user_id, "career_path_id": path_id}
-    )
-    
     # Get career path to check milestones
-    career_path = next((p for p in ENHANCED_CAREER_PATHS if p["id"] == path_id), None)
+    career_path = PATHS_BY_ID.get(path_id)
     if not career_path:
         raise HTTPException(status_code=404, detail="Career path not found")
     
-    if existing:
-        completed = existing.get("completed_milestones", [])
-        achievements = existing.get("achievements", [])
-        
-        if update.completed and update.milestone_id not in completed:
-            completed.append(update.milestone_id)
-            
-            # Check for achievements
-            milestone_count = len(completed)
-            total_milestones = len(career_path["milestones"])
-            
-            # First milestone achievement
-            if milestone_count == 1 and "first_step" not in achievements:
-                achievements.append("first_step")
-            
-            # Halfway achievement
-            if milestone_count >= total_milestones / 2 and "halfway_hero" not in achievements:
-                achievements.append("halfway_hero")
-            
-            # Completion achievement
-            if milestone_count == total_milestones and "path_master" not in achievements:
-                achievements.append("path_master")
-            
-            # Speed achievements (if completed in estimated time or less)
-            # This is simplified - in production you'd track actual time
-            
-        elif not update.completed and update.milestone_id in completed:
-            completed.remove(update.milestone_id)
-        
+    bit = MILESTONE_BITS_BY_PATH[path_id].get(update.milestone_id)
+    if bit is None:
+        raise HTTPException(status_code=404, detail="Milestone not found")
+    
+    # Toggle the milestone and re-evaluate achievements in a single upserting write
+    await db.user_progress.update_one(
+        {"user_id": user_id, "career_path_id": path_id},
+        _progress_update_pipeline(path_id, {bit: update.completed}),
+        upsert=True
+    )
+    
+    return {
+        "success": True,
+        "milestone_id": update.milestone_id,
+        "completed": update.completed
+    }
+
+@api_router.post("/progress/{user_id}/{path_id}/bulk")
+async def update_progress_bulk(user_id: str, path_id: str, bulk: BulkProgressUpdate):
+    """Update several milestones at once in a single write"""
+    if path_id not in PATHS_BY_ID:
+        raise HTTPException(status_code=404, detail="Career path not found")
+    
+    # Later entries for the same milestone win
+    bits = MILESTONE_BITS_BY_PATH[path_id]
+    changes = {}
+    for update in bulk.milestones:
+        bit = bits.get(update.milestone_id)
+        if bit is None:
+            raise HTTPException(status_code=404, detail=f"Milestone not found: {update.milestone_id}")
+        changes[bit] = update.completed
+    
+    if changes:
         await db.user_progress.update_one(
             {"user_id": user_id, "career_path_id": path_id},
-            {
-                "$set": {
-                    "completed_milestones": completed,
-                    "achievements": achievements,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-            }
+            _progress_update_pipeline(path_id, changes),
+            upsert=True
         )
-    else:
-        # Create new progress entry
-        achievements = []
-        completed_list = [update.milestone_id] if update.completed else []
-        
-        if update.completed:
-            achievements.append("first_step")
-        
-        new_progress = {
-            "id": str(uuid.uuid4()),
-            "user_id": user_id,
-            "career_path_id": path_id,
-            "completed_milestones": completed_list,
-            "achievements": achievements,
-            "updated_at": datetime.now(timezone.utc).isoformat()
-        }
-        await db.user_progress.insert_one(new_progress)
     
     return {
         "success": True,
-        "milestone_id": update.milestone_id,
-        "completed": update.completed
+        "updated": len(changes)
     }
 
 # --- Quiz Routes ---
 @api_router.get("/quiz/questions")
-async def get_quiz_questions():
+async def get_quiz_questions(request: Request):
     """Get skill assessment quiz questions"""
-    return SKILL_ASSESSMENT_QUESTIONS
+    return _static_response(request, _QUIZ_QUESTIONS_BYTES, _QUIZ_QUESTIONS_ETAG)
 
 @api_router.post("/quiz/submit")
 async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(get_current_user)):
     """Submit quiz and get personalized recommendations"""
     # Calculate scores for each path
-    path_scores = {}
+    path_scores = Counter()
     learning_style = "all"
     time_multiplier = 1.5
     
     for answer in submission.answers:
-        question = next((q for q in SKILL_ASSESSMENT_QUESTIONS if q["id"] == answer.question_id), None)
+        question = QUESTIONS_BY_ID.get(answer.question_id)
         if not question:
             continue
         
@@ -337,7 +509,7 @@ async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(g
         # Add scores for career paths mentioned in the option
         if "paths" in selected_option:
             for path_id in selected_option["paths"]:
-                path_scores[path_id] = path_scores.get(path_id, 0) + 10
+                path_scores[path_id] += 10
         
         # Track learning preferences
         if "preference" in selected_option:
@@ -348,13 +520,13 @@ async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(g
             time_multiplier = selected_option["time_multiplier"]
     
     # Get top 3 recommended paths
-    sorted_paths = sorted(path_scores.items(), key=lambda x: x[1], reverse=True)[:3]
+    sorted_paths = path_scores.most_common(3)
     
     recommended_paths = []
     for path_id, score in sorted_paths:
-        path = next((p for p in ENHANCED_CAREER_PATHS if p["id"] == path_id), None)
+        path = PATHS_BY_ID.get(path_id)
         if path:
-            total_days = sum(m["estimated_days"] for m in path["milestones"])
+            total_days = TOTAL_DAYS_BY_PATH[path_id]
             estimated_weeks = int((total_days / 7) * time_multiplier)
             
             recommended_paths.append({
@@ -366,7 +538,7 @@ async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(g
             })
     
     # Update user with recommendations
-    await db.users.update_one(
+    user = await db.users.find_one_and_update(
         {"id": current_user["user_id"]},
         {
             "$set": {
@@ -374,8 +546,12 @@ async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(g
                 "recommended_paths": [p["path_id"] for p in recommended_paths],
                 "learning_style": learning_style
             }
-        }
+        },
+        projection={"_id": 0, "id": 1},
+        return_document=ReturnDocument.AFTER
     )
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
     
     return {
         "recommended_paths": recommended_paths,
@@ -389,21 +565,26 @@ async def generate_certificate(request: CertificateRequest, current_user: dict =
     """Generate a completion certificate"""
     user_id = current_user["user_id"]
     
-    # Check if user completed the path
-    progress = await db.user_progress.find_one({
-        "user_id": user_id,
-        "career_path_id": request.path_id
-    })
+    # Check if user completed the path and get user info
+    progress, user = await asyncio.gather(
+        db.user_progress.find_one({
+            "user_id": user_id,
+            "career_path_id": request.path_id
+        }, {"_id": 0, "completed_mask": 1, "achievements": 1}),
+        db.users.find_one({"id": user_id}, {"_id": 0, "name": 1})
+    )
     
     if not progress:
         raise HTTPException(status_code=404, detail="No progress found for this path")
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
     
     # Get career path
-    career_path = next((p for p in ENHANCED_CAREER_PATHS if p["id"] == request.path_id), None)
+    career_path = PATHS_BY_ID.get(request.path_id)
     if not career_path:
         raise HTTPException(status_code=404, detail="Career path not found")
     
-    completed_count = len(progress.get("completed_milestones", []))
+    completed_count = _count_completed(progress.get("completed_mask", 0))
     total_count = len(career_path["milestones"])
     
     if completed_count < total_count:
@@ -412,17 +593,14 @@ async def generate_certificate(request: CertificateRequest, current_user: dict =
             detail=f"Path not completed. {completed_count}/{total_count} milestones done."
         )
     
-    # Get user info
-    user = await db.users.find_one({"id": user_id}, {"_id": 0})
-    
     # Generate certificate data
     certificate = {
-        "id": str(uuid.uuid4()),
+        "id": uuid.uuid4().hex,
         "user_id": user_id,
         "user_name": user.get("name", "Student"),
         "path_id": request.path_id,
         "path_name": career_path["name"],
-        "completion_date": datetime.now(timezone.utc).isoformat(),
+        "completion_date": utcnow(),
         "total_milestones": total_count,
         "achievements": progress.get("achievements", [])
     }
@@ -463,33 +641,37 @@ async def share_progress(share_data: ShareProgress, current_user: dict = Depends
     """Generate shareable link for progress"""
     user_id = current_user["user_id"]
     
-    # Get progress
-    progress = await db.user_progress.find_one({
-        "user_id": user_id,
-        "career_path_id": share_data.path_id
-    })
+    # Get progress and user info
+    progress, user = await asyncio.gather(
+        db.user_progress.find_one({
+            "user_id": user_id,
+            "career_path_id": share_data.path_id
+        }, {"_id": 0, "completed_mask": 1, "achievements": 1}),
+        db.users.find_one({"id": user_id}, {"_id": 0, "name": 1})
+    )
     
     if not progress:
         raise HTTPException(status_code=404, detail="No progress found for this path")
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
     
-    # Get user and path info
-    user = await db.users.find_one({"id": user_id}, {"_id": 0, "hashed_password": 0})
-    career_path = next((p for p in ENHANCED_CAREER_PATHS if p["id"] == share_data.path_id), None)
+    # Get path info
+    career_path = PATHS_BY_ID.get(share_data.path_id)
     
     if not career_path:
         raise HTTPException(status_code=404, detail="Career path not found")
     
     # Create shareable snapshot
-    share_id = str(uuid.uuid4())
+    share_id = uuid.uuid4().hex
     snapshot = {
         "id": share_id,
         "user_name": user.get("name", "Anonymous"),
         "path_id": share_data.path_id,
         "path_name": career_path["name"],
-        "completed_milestones": len(progress.get("completed_milestones", [])),
+        "completed_milestones": _count_completed(progress.get("completed_mask", 0)),
         "total_milestones": len(career_path["milestones"]),
         "achievements": progress.get("achievements", []),
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": utcnow()
     }
     
     await db.shared_progress.insert_one(snapshot)
@@ -512,63 +694,26 @@ async def view_shared_progress(share_id: str):
 
 # --- Achievements Routes ---
 @api_router.get("/achievements")
-async def get_achievements():
+async def get_achievements(request: Request):
     """Get all available achievements"""
-    return {
-        "achievements": [
-            {
-                "id": "first_step",
-                "name": "First Step",
-                "description": "Complete your first milestone",
-                "icon": "🎯",
-                "color": "#10B981"
-            },
-            {
-                "id": "halfway_hero",
-                "name": "Halfway Hero",
-                "description": "Complete 50% of a career path",
-                "icon": "🚀",
-                "color": "#3B82F6"
-            },
-            {
-                "id": "path_master",
-                "name": "Path Master",
-                "description": "Complete an entire career path",
-                "icon": "👑",
-                "color": "#F59E0B"
-            },
-            {
-                "id": "speed_demon",
-                "name": "Speed Demon",
-                "description": "Complete a path in record time",
-                "icon": "⚡",
-                "color": "#EF4444"
-            },
-            {
-                "id": "multi_path",
-                "name": "Multi-Path Master",
-                "description": "Complete 3 different career paths",
-                "icon": "🌟",
-                "color": "#8B5CF6"
-            }
-        ]
-    }
+    return _static_response(request, _ACHIEVEMENTS_BYTES, _ACHIEVEMENTS_ETAG)
 
 @api_router.get("/user/{user_id}/achievements")
 async def get_user_achievements(user_id: str):
     """Get all achievements earned by a user"""
-    progress_list = await db.user_progress.find({"user_id": user_id}, {"_id": 0}).to_list(100)
+    progress_list = await db.user_progress.find(
+        {"user_id": user_id},
+        {"_id": 0, "career_path_id": 1, "achievements": 1, "completed_mask": 1}
+    ).to_list(100)
     
     all_achievements = set()
+    completed_paths = 0
     for progress in progress_list:
-        achievements = progress.get("achievements", [])
-        all_achievements.update(achievements)
-    
-    # Check for multi-path achievement
-    completed_paths = sum(1 for p in progress_list 
-                          if len(p.get("completed_milestones", [])) == 
-                          len(next((path for path in ENHANCED_CAREER_PATHS 
-                                   if path["id"] == p["career_path_id"]), {}).get("milestones", [])))
+        all_achievements.update(progress.get("achievements", []))
+        # Check for multi-path achievement
+        completed = _count_completed(progress.get("completed_mask", 0))
+        if completed == MILESTONE_COUNT_BY_PATH.get(progress["career_path_id"], -1):
+            completed_paths += 1
     
     if completed_paths >= 3:
         all_achievements.add("multi_path")
@@ -585,6 +730,8 @@ async def get_user_certificates(user_id: str):
 # Include router
 app.include_router(api_router)
 
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -599,6 +746,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def ping_db():
+    """Fail fast if MongoDB is unreachable"""
+    await client.admin.command("ping")
+    logger.info("Connected to MongoDB")
+
+async def _create_index(collection, keys: list, **kwargs):
+    # Data written before these indexes existed may hold duplicates that block a
+    # unique build; log it so they can be cleaned up instead of failing startup
+    try:
+        await collection.create_index(keys, **kwargs)
+    except OperationFailure as e:
+        logger.error("Could not create index %s on %s: %s", keys, collection.name, e)
+
+@app.on_event("startup")
+async def create_indexes():
+    """Create indexes backing the hot query shapes"""
+    await _create_index(
+        db.user_progress, [("user_id", 1), ("career_path_id", 1)], unique=True, background=True
+    )
+    # _id breaks updated_at ties so paging through a user's progress is stable
+    await _create_index(db.user_progress, [("user_id", 1), ("updated_at", -1), ("_id", -1)])
+    await _create_index(db.certificates, [("id", 1)], unique=True)
+    await _create_index(db.shared_progress, [("id", 1)], unique=True)
+    await _create_index(db.users, [("email", 1)], unique=True)
+    await _create_index(db.users, [("id", 1)], unique=True)
+
+@app.on_event("startup")
+async def migrate_completed_milestones():
+    """Convert legacy completed_milestones arrays to completed_mask"""
+    legacy = db.user_progress.find(
+        {"completed_mask": {"$exists": False}},
+        {"_id": 1, "career_path_id": 1, "completed_milestones": 1}
+    )
+    async for progress in legacy:
+        bits = MILESTONE_BITS_BY_PATH.get(progress["career_path_id"], {})
+        mask = 0
+        for milestone_id in progress.get("completed_milestones", []):
+            if milestone_id in bits:
+                mask |= 1 << bits[milestone_id]
+        await db.user_progress.update_one(
+            {"_id": progress["_id"]},
+            {"$set": {"completed_mask": mask}, "$unset": {"completed_milestones": ""}}
+        )
+
+# Timestamps written before they were stored as BSON dates are ISO strings
+TIMESTAMP_FIELDS = {
+    "users": "created_at",
+    "user_progress": "updated_at",
+    "certificates": "completion_date",
+    "shared_progress": "created_at",
+}
+
+@app.on_event("startup")
+async def migrate_string_timestamps():
+    """Convert legacy ISO-string timestamps to BSON dates so they sort with new ones"""
+    await asyncio.gather(*(
+        db[collection].update_many(
+            {field: {"$type": "string"}},
+            [{"$set": {field: {"$dateFromString": {"dateString": f"${field}", "onError": f"${field}"}}}}]
+        )
+        for collection, field in TIMESTAMP_FIELDS.items()
+    ))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    await client.close()
+    PWD_POOL.shutdown(wait=False)
@@ -4,23 +4,38 @@ Comprehensive Backend API Testing for SUPERCHARGE Career Roadmap Platform
 Tests all backend endpoints with authentication, progress tracking, certificates, etc.
 """
 
-import requests
+import argparse
+import asyncio
+import httpx
 import json
+import logging
+import orjson
 import sys
 import os
+import re
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from datetime import datetime
+from typing import Optional
+
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
 
 # Get backend URL from frontend .env file
 def get_backend_url():
     try:
         with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
+            data = f.read()
     except Exception as e:
         print(f"Error reading backend URL: {e}")
         return None
+    match = re.search(r'^REACT_APP_BACKEND_URL=(.*)$', data, re.M)
+    return match.group(1).strip() if match else None
 
+# Resolved once at import; nothing re-reads the file afterwards
 BASE_URL = get_backend_url()
 if not BASE_URL:
     print("ERROR: Could not get backend URL from frontend/.env")
@@ -30,215 +45,336 @@ API_BASE = f"{BASE_URL}/api"
 
 print(f"Testing backend at: {API_BASE}")
 
-# Global variables to store test data
-auth_token = None
-user_id = None
-path_id = None
-certificate_id = None
-share_id = None
+# Concurrent suites log through a queue so none of them blocks on stdout
+log = logging.getLogger('supercharge.test')
+
+def setup_logging():
+    """Route test output through a background listener writing to stdout"""
+    queue = SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(QueueHandler(queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener = QueueListener(queue, handler)
+    listener.start()
+    return listener
+
+# Cap on in-flight requests when a suite fans out
+MAX_CONCURRENT_REQUESTS = 10
+
+# Keep-alive connection pool shared by every request in a run; over TLS the
+# client negotiates HTTP/2 and multiplexes concurrent requests on one connection
+POOL_MAXSIZE = 16
+KEEPALIVE_TIMEOUT = 30
+
+# Bound on career path details cached per run
+PATH_CACHE_MAXSIZE = 32
 
-def make_request(method, endpoint, data=None, headers=None, auth_required=True):
+# Healthy requests finish well under a second; fail unreachable hosts and stalled
+# reads quickly instead of waiting out a flat 30s
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 10
+REQUEST_TIMEOUT = httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+
+# Retries only cover failures to connect, where the request was never sent
+MAX_RETRIES = 2
+
+@dataclass(slots=True)
+class TestContext:
+    """Test data shared between suites, passed explicitly instead of via globals"""
+    auth_token: Optional[str] = None
+    # Built once after signup and shared by every authenticated request
+    auth_headers: Optional[dict] = None
+    user_id: Optional[str] = None
+    path_id: Optional[str] = None
+    certificate_id: Optional[str] = None
+    share_id: Optional[str] = None
+    # Career path details keyed by path id, reused across suites
+    path_cache: dict = field(default_factory=dict)
+
+async def make_request(client, ctx, method, endpoint, data=None, headers=None, auth_required=True):
     """Make HTTP request with proper error handling"""
-    url = f"{API_BASE}{endpoint}"
-    
     # Add auth header if required and token available
-    if auth_required and auth_token:
-        if headers is None:
-            headers = {}
-        headers['Authorization'] = f'Bearer {auth_token}'
+    if auth_required and ctx.auth_headers:
+        headers = ctx.auth_headers if headers is None else {**headers, **ctx.auth_headers}
     
     try:
         if method.upper() == 'GET':
-            response = requests.get(url, headers=headers, timeout=30)
+            return await client.get(endpoint, headers=headers)
         elif method.upper() == 'POST':
-            headers = headers or {}
-            headers['Content-Type'] = 'application/json'
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            # The client sends Content-Type: application/json by default
+            return await client.post(endpoint, content=orjson.dumps(data), headers=headers)
         else:
             raise ValueError(f"Unsupported method: {method}")
-        
-        return response
-    except requests.exceptions.RequestException as e:
-        print(f"Request failed: {e}")
+    except httpx.HTTPError as e:
+        log.info(f"Request failed: {e}")
         return None
 
-def test_auth_flow():
-    """Test authentication endpoints"""
-    global auth_token, user_id
+def cache_path(ctx, path_id, path_data):
+    """Remember a career path, evicting the oldest entry once the cache is full"""
+    if path_id not in ctx.path_cache and len(ctx.path_cache) >= PATH_CACHE_MAXSIZE:
+        ctx.path_cache.pop(next(iter(ctx.path_cache)))
+    ctx.path_cache[path_id] = path_data
+
+async def get_path(client, ctx, path_id):
+    """Get career path details, fetching them only on the first call per run"""
+    if path_id in ctx.path_cache:
+        return ctx.path_cache[path_id]
+    
+    response = await make_request(client, ctx, 'GET', f'/career-paths/{path_id}', auth_required=False)
+    if not response or response.status_code != 200:
+        return None
     
-    print("\n=== TESTING AUTHENTICATION FLOW ===")
+    path_data = orjson.loads(response.content)
+    cache_path(ctx, path_id, path_data)
+    return path_data
+
+async def complete_milestones(client, ctx, milestones):
+    """Mark milestones complete concurrently, returning responses in milestone order"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    progress_endpoint = f'/progress/{ctx.user_id}/{ctx.path_id}'
+    payloads = [{"milestone_id": m['id'], "completed": True} for m in milestones]
+    
+    async def complete(update_data):
+        async with semaphore:
+            return await make_request(client, ctx, 'POST', progress_endpoint, update_data)
+    
+    return await asyncio.gather(*(complete(payload) for payload in payloads))
+
+def route_missing(response):
+    """Whether the server lacks the route, as opposed to the route itself returning 404"""
+    if response is None:
+        return False
+    if response.status_code == 405:
+        return True
+    if response.status_code != 404:
+        return False
+    # FastAPI's default 404 for unknown routes, not a route's own "... not found"
+    try:
+        return orjson.loads(response.content) == {"detail": "Not Found"}
+    except orjson.JSONDecodeError:
+        return False
+
+async def fetch_path_progress(client, ctx):
+    """Get the user's progress for the selected path, or None on failure"""
+    response = await make_request(client, ctx, 'GET', f'/progress/{ctx.user_id}/{ctx.path_id}')
+    if response and response.status_code == 200:
+        return orjson.loads(response.content)
+    log.info(f"❌ Get path progress failed - Status: {response.status_code if response else 'No response'}")
+    if response:
+        log.info(f"Response: {response.text}")
+    return None
+
+async def test_auth_flow(client, ctx, thorough=False):
+    """Test authentication endpoints"""
+    log.info("\n=== TESTING AUTHENTICATION FLOW ===")
     
     # Test signup
-    print("1. Testing user signup...")
+    log.info("1. Testing user signup...")
     signup_data = {
         "email": "test@supercharge.com",
         "password": "TestPass123",
         "name": "Test User"
     }
     
-    response = make_request('POST', '/auth/signup', signup_data, auth_required=False)
+    response = await make_request(client, ctx, 'POST', '/auth/signup', signup_data, auth_required=False)
     if response and response.status_code == 200:
-        data = response.json()
-        auth_token = data.get('access_token')
-        user_id = data.get('user', {}).get('id')
-        print(f"✅ Signup successful - User ID: {user_id}")
+        data = orjson.loads(response.content)
+        ctx.auth_token = data.get('access_token')
+        ctx.auth_headers = {'Authorization': f'Bearer {ctx.auth_token}'}
+        ctx.user_id = data.get('user', {}).get('id')
+        log.info(f"✅ Signup successful - User ID: {ctx.user_id}")
     else:
-        print(f"❌ Signup failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Signup failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
-    # Test login
-    print("2. Testing user login...")
+    # The signup token is already valid, so login is only exercised with --thorough;
+    # login and get current user both depend on signup alone and run concurrently
     login_data = {
         "email": "test@supercharge.com",
         "password": "TestPass123"
     }
+    pending = [make_request(client, ctx, 'GET', '/auth/me')]
+    if thorough:
+        pending.append(make_request(client, ctx, 'POST', '/auth/login', login_data, auth_required=False))
+    me_response, *login_responses = await asyncio.gather(*pending)
     
-    response = make_request('POST', '/auth/login', login_data, auth_required=False)
-    if response and response.status_code == 200:
-        data = response.json()
-        login_token = data.get('access_token')
-        print(f"✅ Login successful - Token received")
-    else:
-        print(f"❌ Login failed - Status: {response.status_code if response else 'No response'}")
-        if response:
-            print(f"Response: {response.text}")
-        return False
+    # Test login
+    if thorough:
+        log.info("2. Testing user login...")
+        response = login_responses[0]
+        if response and response.status_code == 200:
+            data = orjson.loads(response.content)
+            login_token = data.get('access_token')
+            log.info(f"✅ Login successful - Token received")
+        else:
+            log.info(f"❌ Login failed - Status: {response.status_code if response else 'No response'}")
+            if response:
+                log.info(f"Response: {response.text}")
+            return False
     
     # Test get current user
-    print("3. Testing get current user...")
-    response = make_request('GET', '/auth/me')
+    log.info("3. Testing get current user...")
+    response = me_response
     if response and response.status_code == 200:
-        user_data = response.json()
-        print(f"✅ Get user info successful - Name: {user_data.get('name')}")
+        user_data = orjson.loads(response.content)
+        log.info(f"✅ Get user info successful - Name: {user_data.get('name')}")
     else:
-        print(f"❌ Get user info failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get user info failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     return True
 
-def test_career_paths():
+async def test_career_paths(client, ctx):
     """Test career paths endpoints"""
-    global path_id
-    
-    print("\n=== TESTING CAREER PATHS ===")
+    log.info("\n=== TESTING CAREER PATHS ===")
     
     # Test get all career paths
-    print("1. Testing get all career paths...")
-    response = make_request('GET', '/career-paths', auth_required=False)
+    log.info("1. Testing get all career paths...")
+    response = await make_request(client, ctx, 'GET', '/career-paths', auth_required=False)
     if response and response.status_code == 200:
-        paths = response.json()
+        paths = orjson.loads(response.content)
         if paths and len(paths) > 0:
-            path_id = paths[0]['id']
-            print(f"✅ Get career paths successful - Found {len(paths)} paths")
-            print(f"First path: {paths[0]['name']} (ID: {path_id})")
+            ctx.path_id = paths[0]['id']
+            log.info(f"✅ Get career paths successful - Found {len(paths)} paths")
+            log.info(f"First path: {paths[0]['name']} (ID: {ctx.path_id})")
         else:
-            print("❌ No career paths found")
+            log.info("❌ No career paths found")
             return False
     else:
-        print(f"❌ Get career paths failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get career paths failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test get specific career path
-    print("2. Testing get specific career path...")
-    response = make_request('GET', f'/career-paths/{path_id}', auth_required=False)
+    log.info("2. Testing get specific career path...")
+    response = await make_request(client, ctx, 'GET', f'/career-paths/{ctx.path_id}', auth_required=False)
     if response and response.status_code == 200:
-        path_data = response.json()
+        path_data = orjson.loads(response.content)
+        cache_path(ctx, ctx.path_id, path_data)
         milestones_count = len(path_data.get('milestones', []))
-        print(f"✅ Get specific path successful - {milestones_count} milestones")
+        log.info(f"✅ Get specific path successful - {milestones_count} milestones")
     else:
-        print(f"❌ Get specific path failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get specific path failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     return True
 
-def test_progress_tracking():
+async def test_progress_tracking(client, ctx):
     """Test progress tracking endpoints"""
-    print("\n=== TESTING PROGRESS TRACKING ===")
+    log.info("\n=== TESTING PROGRESS TRACKING ===")
     
     # Test get user progress (all paths)
-    print("1. Testing get user progress (all paths)...")
-    response = make_request('GET', f'/progress/{user_id}')
+    log.info("1. Testing get user progress (all paths)...")
+    response = await make_request(client, ctx, 'GET', f'/progress/{ctx.user_id}')
     if response and response.status_code == 200:
-        progress_list = response.json()
-        print(f"✅ Get user progress successful - {len(progress_list)} paths tracked")
+        progress_list = orjson.loads(response.content)
+        log.info(f"✅ Get user progress successful - {len(progress_list)} paths tracked")
     else:
-        print(f"❌ Get user progress failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get user progress failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test get progress for specific path
-    print("2. Testing get progress for specific path...")
-    response = make_request('GET', f'/progress/{user_id}/{path_id}')
+    log.info("2. Testing get progress for specific path...")
+    response = await make_request(client, ctx, 'GET', f'/progress/{ctx.user_id}/{ctx.path_id}')
     if response and response.status_code == 200:
-        path_progress = response.json()
+        path_progress = orjson.loads(response.content)
         completed_count = len(path_progress.get('completed_milestones', []))
-        print(f"✅ Get path progress successful - {completed_count} milestones completed")
+        log.info(f"✅ Get path progress successful - {completed_count} milestones completed")
     else:
-        print(f"❌ Get path progress failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get path progress failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Get path details to find milestone IDs
-    path_response = make_request('GET', f'/career-paths/{path_id}', auth_required=False)
-    if not path_response or path_response.status_code != 200:
-        print("❌ Could not get path details for milestone testing")
+    path_data = await get_path(client, ctx, ctx.path_id)
+    if not path_data:
+        log.info("❌ Could not get path details for milestone testing")
         return False
     
-    path_data = path_response.json()
     milestones = path_data.get('milestones', [])
     if not milestones:
-        print("❌ No milestones found in path")
+        log.info("❌ No milestones found in path")
         return False
     
     # Test marking milestones as complete
-    print("3. Testing milestone completion...")
-    for i, milestone in enumerate(milestones[:3]):  # Test first 3 milestones
-        milestone_id = milestone['id']
-        update_data = {
-            "milestone_id": milestone_id,
-            "completed": True
-        }
-        
-        response = make_request('POST', f'/progress/{user_id}/{path_id}', update_data)
+    log.info("3. Testing milestone completion...")
+    first_milestones = milestones[:3]  # Test first 3 milestones
+    responses = await complete_milestones(client, ctx, first_milestones)
+    for i, (milestone, response) in enumerate(zip(first_milestones, responses)):
         if response and response.status_code == 200:
-            result = response.json()
-            print(f"✅ Milestone {i+1} marked complete - {milestone['title']}")
+            result = orjson.loads(response.content)
+            log.info(f"✅ Milestone {i+1} marked complete - {milestone['title']}")
         else:
-            print(f"❌ Failed to mark milestone {i+1} complete - Status: {response.status_code if response else 'No response'}")
+            log.info(f"❌ Failed to mark milestone {i+1} complete - Status: {response.status_code if response else 'No response'}")
             if response:
-                print(f"Response: {response.text}")
+                log.info(f"Response: {response.text}")
             return False
     
+    # Read progress back to check the stored completion mask round-trips
+    log.info("4. Testing completed milestones are persisted...")
+    expected = [m['id'] for m in first_milestones]
+    path_progress = await fetch_path_progress(client, ctx)
+    if path_progress is None:
+        return False
+    if path_progress.get('completed_milestones') != expected:
+        log.info(f"❌ Completed milestones mismatch - Expected: {expected}, Got: {path_progress.get('completed_milestones')}")
+        return False
+    if 'first_step' not in path_progress.get('achievements', []):
+        log.info(f"❌ first_step achievement missing - Got: {path_progress.get('achievements')}")
+        return False
+    log.info(f"✅ Completed milestones persisted in path order with first_step awarded")
+    
+    # Test un-completing a milestone
+    log.info("5. Testing milestone un-completion...")
+    removed = first_milestones[-1]['id']
+    update_data = {"milestone_id": removed, "completed": False}
+    response = await make_request(client, ctx, 'POST', f'/progress/{ctx.user_id}/{ctx.path_id}', update_data)
+    if not response or response.status_code != 200:
+        log.info(f"❌ Failed to mark milestone incomplete - Status: {response.status_code if response else 'No response'}")
+        if response:
+            log.info(f"Response: {response.text}")
+        return False
+    path_progress = await fetch_path_progress(client, ctx)
+    if path_progress is None:
+        return False
+    expected.remove(removed)
+    if path_progress.get('completed_milestones') != expected:
+        log.info(f"❌ Milestone not removed - Expected: {expected}, Got: {path_progress.get('completed_milestones')}")
+        return False
+    log.info(f"✅ Milestone marked incomplete - {first_milestones[-1]['title']}")
+    
     return True
 
-def test_quiz_flow():
+async def test_quiz_flow(client, ctx):
     """Test quiz endpoints"""
-    print("\n=== TESTING QUIZ FLOW ===")
+    log.info("\n=== TESTING QUIZ FLOW ===")
     
     # Test get quiz questions
-    print("1. Testing get quiz questions...")
-    response = make_request('GET', '/quiz/questions', auth_required=False)
+    log.info("1. Testing get quiz questions...")
+    response = await make_request(client, ctx, 'GET', '/quiz/questions', auth_required=False)
     if response and response.status_code == 200:
-        questions = response.json()
-        print(f"✅ Get quiz questions successful - {len(questions)} questions")
+        questions = orjson.loads(response.content)
+        log.info(f"✅ Get quiz questions successful - {len(questions)} questions")
     else:
-        print(f"❌ Get quiz questions failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get quiz questions failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test submit quiz answers
-    print("2. Testing quiz submission...")
+    log.info("2. Testing quiz submission...")
     # Create sample answers for the first few questions
     answers = []
     for i, question in enumerate(questions[:5]):  # Answer first 5 questions
@@ -251,227 +387,304 @@ def test_quiz_flow():
         "answers": answers
     }
     
-    response = make_request('POST', '/quiz/submit', quiz_submission)
+    response = await make_request(client, ctx, 'POST', '/quiz/submit', quiz_submission)
     if response and response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         recommended_paths = result.get('recommended_paths', [])
-        print(f"✅ Quiz submission successful - {len(recommended_paths)} paths recommended")
+        log.info(f"✅ Quiz submission successful - {len(recommended_paths)} paths recommended")
     else:
-        print(f"❌ Quiz submission failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Quiz submission failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     return True
 
-def test_achievements():
+async def test_achievements(client, ctx):
     """Test achievements endpoints"""
-    print("\n=== TESTING ACHIEVEMENTS ===")
+    log.info("\n=== TESTING ACHIEVEMENTS ===")
     
     # Test get all achievements
-    print("1. Testing get all achievements...")
-    response = make_request('GET', '/achievements', auth_required=False)
+    log.info("1. Testing get all achievements...")
+    response = await make_request(client, ctx, 'GET', '/achievements', auth_required=False)
     if response and response.status_code == 200:
-        achievements_data = response.json()
+        achievements_data = orjson.loads(response.content)
         achievements = achievements_data.get('achievements', [])
-        print(f"✅ Get all achievements successful - {len(achievements)} achievements available")
+        log.info(f"✅ Get all achievements successful - {len(achievements)} achievements available")
     else:
-        print(f"❌ Get all achievements failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get all achievements failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test get user achievements
-    print("2. Testing get user achievements...")
-    response = make_request('GET', f'/user/{user_id}/achievements')
+    log.info("2. Testing get user achievements...")
+    response = await make_request(client, ctx, 'GET', f'/user/{ctx.user_id}/achievements')
     if response and response.status_code == 200:
-        user_achievements = response.json()
+        user_achievements = orjson.loads(response.content)
         earned_count = len(user_achievements.get('achievements', []))
-        print(f"✅ Get user achievements successful - {earned_count} achievements earned")
+        log.info(f"✅ Get user achievements successful - {earned_count} achievements earned")
     else:
-        print(f"❌ Get user achievements failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get user achievements failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     return True
 
-def complete_entire_path():
+async def complete_entire_path(client, ctx):
     """Complete all milestones in the path to enable certificate generation"""
-    print("\n=== COMPLETING ENTIRE PATH FOR CERTIFICATE ===")
+    log.info("\n=== COMPLETING ENTIRE PATH FOR CERTIFICATE ===")
     
     # Get path details
-    path_response = make_request('GET', f'/career-paths/{path_id}', auth_required=False)
-    if not path_response or path_response.status_code != 200:
-        print("❌ Could not get path details")
+    path_data = await get_path(client, ctx, ctx.path_id)
+    if not path_data:
+        log.info("❌ Could not get path details")
         return False
     
-    path_data = path_response.json()
     milestones = path_data.get('milestones', [])
     
-    print(f"Completing all {len(milestones)} milestones...")
+    log.info(f"Completing all {len(milestones)} milestones...")
     
-    for i, milestone in enumerate(milestones):
-        milestone_id = milestone['id']
-        update_data = {
-            "milestone_id": milestone_id,
-            "completed": True
-        }
-        
-        response = make_request('POST', f'/progress/{user_id}/{path_id}', update_data)
-        if response and response.status_code == 200:
-            print(f"✅ Milestone {i+1}/{len(milestones)} completed")
-        else:
-            print(f"❌ Failed to complete milestone {i+1}")
-            return False
+    # One bulk request; servers without the bulk route get per-milestone requests
+    bulk = {"milestones": [{"milestone_id": m['id'], "completed": True} for m in milestones]}
+    response = await make_request(client, ctx, 'POST', f'/progress/{ctx.user_id}/{ctx.path_id}/bulk', bulk)
+    if response and response.status_code == 200:
+        log.info(f"✅ All {len(milestones)} milestones completed in one request")
+    elif route_missing(response):
+        responses = await complete_milestones(client, ctx, milestones)
+        for i, response in enumerate(responses):
+            if response and response.status_code == 200:
+                log.info(f"✅ Milestone {i+1}/{len(milestones)} completed")
+            else:
+                log.info(f"❌ Failed to complete milestone {i+1}")
+                return False
+    else:
+        log.info(f"❌ Bulk milestone completion failed - Status: {response.status_code if response else 'No response'}")
+        if response:
+            log.info(f"Response: {response.text}")
+        return False
+    
+    path_progress = await fetch_path_progress(client, ctx)
+    if path_progress is None:
+        return False
+    expected = [m['id'] for m in milestones]
+    if path_progress.get('completed_milestones') != expected:
+        log.info(f"❌ Path not complete - Expected: {expected}, Got: {path_progress.get('completed_milestones')}")
+        return False
+    log.info("✅ Path fully completed")
     
     return True
 
-def test_certificate_flow():
+async def test_certificate_flow(client, ctx):
     """Test certificate generation and download"""
-    global certificate_id
-    
-    print("\n=== TESTING CERTIFICATE FLOW ===")
+    log.info("\n=== TESTING CERTIFICATE FLOW ===")
     
     # First complete the entire path
-    if not complete_entire_path():
+    if not await complete_entire_path(client, ctx):
         return False
     
     # Test certificate generation
-    print("1. Testing certificate generation...")
+    log.info("1. Testing certificate generation...")
     cert_request = {
-        "path_id": path_id
+        "path_id": ctx.path_id
     }
     
-    response = make_request('POST', '/certificate/generate', cert_request)
+    response = await make_request(client, ctx, 'POST', '/certificate/generate', cert_request)
     if response and response.status_code == 200:
-        cert_data = response.json()
-        certificate_id = cert_data.get('certificate_id')
-        print(f"✅ Certificate generation successful - ID: {certificate_id}")
+        cert_data = orjson.loads(response.content)
+        ctx.certificate_id = cert_data.get('certificate_id')
+        log.info(f"✅ Certificate generation successful - ID: {ctx.certificate_id}")
     else:
-        print(f"❌ Certificate generation failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Certificate generation failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test certificate download
-    print("2. Testing certificate download...")
-    response = make_request('GET', f'/certificate/download/{certificate_id}', auth_required=False)
+    log.info("2. Testing certificate download...")
+    response = await make_request(client, ctx, 'GET', f'/certificate/download/{ctx.certificate_id}', auth_required=False)
     if response and response.status_code == 200:
-        cert_data = response.json()
-        print(f"✅ Certificate download successful - User: {cert_data.get('user_name')}")
+        cert_data = orjson.loads(response.content)
+        log.info(f"✅ Certificate download successful - User: {cert_data.get('user_name')}")
     else:
-        print(f"❌ Certificate download failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Certificate download failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test certificate public view
-    print("3. Testing certificate public view...")
-    response = make_request('GET', f'/certificate/{certificate_id}', auth_required=False)
+    log.info("3. Testing certificate public view...")
+    response = await make_request(client, ctx, 'GET', f'/certificate/{ctx.certificate_id}', auth_required=False)
     if response and response.status_code == 200:
-        cert_data = response.json()
-        print(f"✅ Certificate public view successful")
+        cert_data = orjson.loads(response.content)
+        log.info(f"✅ Certificate public view successful")
     else:
-        print(f"❌ Certificate public view failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Certificate public view failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     return True
 
-def test_social_features():
+async def test_social_features(client, ctx):
     """Test social sharing features"""
-    global share_id
-    
-    print("\n=== TESTING SOCIAL FEATURES ===")
+    log.info("\n=== TESTING SOCIAL FEATURES ===")
     
     # Test create shareable progress link
-    print("1. Testing create shareable progress link...")
+    log.info("1. Testing create shareable progress link...")
     share_data = {
-        "path_id": path_id
+        "path_id": ctx.path_id
     }
     
-    response = make_request('POST', '/share/progress', share_data)
+    response = await make_request(client, ctx, 'POST', '/share/progress', share_data)
     if response and response.status_code == 200:
-        share_result = response.json()
-        share_id = share_result.get('share_id')
-        print(f"✅ Share progress successful - Share ID: {share_id}")
+        share_result = orjson.loads(response.content)
+        ctx.share_id = share_result.get('share_id')
+        log.info(f"✅ Share progress successful - Share ID: {ctx.share_id}")
     else:
-        print(f"❌ Share progress failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Share progress failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test view shared progress
-    print("2. Testing view shared progress...")
-    response = make_request('GET', f'/share/{share_id}', auth_required=False)
+    log.info("2. Testing view shared progress...")
+    response = await make_request(client, ctx, 'GET', f'/share/{ctx.share_id}', auth_required=False)
     if response and response.status_code == 200:
-        shared_data = response.json()
-        print(f"✅ View shared progress successful - User: {shared_data.get('user_name')}")
+        shared_data = orjson.loads(response.content)
+        log.info(f"✅ View shared progress successful - User: {shared_data.get('user_name')}")
     else:
-        print(f"❌ View shared progress failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ View shared progress failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     # Test get user certificates list
-    print("3. Testing get user certificates list...")
-    response = make_request('GET', f'/user/{user_id}/certificates')
+    log.info("3. Testing get user certificates list...")
+    response = await make_request(client, ctx, 'GET', f'/user/{ctx.user_id}/certificates')
     if response and response.status_code == 200:
-        certificates = response.json()
-        print(f"✅ Get user certificates successful - {len(certificates)} certificates")
+        certificates = orjson.loads(response.content)
+        log.info(f"✅ Get user certificates successful - {len(certificates)} certificates")
     else:
-        print(f"❌ Get user certificates failed - Status: {response.status_code if response else 'No response'}")
+        log.info(f"❌ Get user certificates failed - Status: {response.status_code if response else 'No response'}")
         if response:
-            print(f"Response: {response.text}")
+            log.info(f"Response: {response.text}")
         return False
     
     return True
 
-def main():
+async def run_concurrently(client, ctx, suites, fail_fast=False):
+    """Run suites concurrently; with fail_fast, cancel the rest once one fails"""
+    tasks = {asyncio.create_task(suite(client, ctx)): name for name, suite in suites}
+    results = {}
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            name = tasks[task]
+            try:
+                results[name] = task.result()
+            except Exception as e:
+                log.info(f"❌ {name} raised {e!r}")
+                results[name] = False
+        
+        if fail_fast and not all(results.values()):
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            break
+    
+    return [(name, results[name]) for name, _ in suites if name in results]
+
+async def amain(args):
     """Run all tests"""
-    print("🚀 Starting SUPERCHARGE Backend API Tests")
-    print(f"Backend URL: {API_BASE}")
+    log.info("🚀 Starting SUPERCHARGE Backend API Tests")
+    log.info(f"Backend URL: {API_BASE}")
     
     test_results = []
     
-    # Run all test suites
-    test_results.append(("Authentication Flow", test_auth_flow()))
-    test_results.append(("Career Paths", test_career_paths()))
-    test_results.append(("Progress Tracking", test_progress_tracking()))
-    test_results.append(("Quiz Flow", test_quiz_flow()))
-    test_results.append(("Achievements", test_achievements()))
-    test_results.append(("Certificate Flow", test_certificate_flow()))
-    test_results.append(("Social Features", test_social_features()))
+    ctx = TestContext()
+    
+    limits = httpx.Limits(max_connections=POOL_MAXSIZE, keepalive_expiry=KEEPALIVE_TIMEOUT)
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=MAX_RETRIES)
+    async with httpx.AsyncClient(
+        base_url=API_BASE,
+        timeout=REQUEST_TIMEOUT,
+        transport=transport,
+        headers={'Content-Type': 'application/json'}
+    ) as client:
+        # Authentication must run first to populate the token and user id
+        test_results.append(("Authentication Flow", await test_auth_flow(client, ctx, thorough=args.thorough)))
+        
+        def should_stop():
+            return args.fail_fast and not all(result for _, result in test_results)
+        
+        # These suites only depend on authentication, so run them concurrently
+        independent = [
+            ("Career Paths", test_career_paths),
+            ("Quiz Flow", test_quiz_flow),
+            ("Achievements", test_achievements),
+        ]
+        # These depend on the selected path and its completion state
+        dependent = [
+            ("Progress Tracking", test_progress_tracking),
+            ("Certificate Flow", test_certificate_flow),
+            ("Social Features", test_social_features),
+        ]
+        
+        if not should_stop():
+            test_results.extend(await run_concurrently(client, ctx, independent, args.fail_fast))
+        for name, suite in dependent:
+            if should_stop():
+                break
+            test_results.append((name, await suite(client, ctx)))
+        
+        if len(test_results) < 1 + len(independent) + len(dependent):
+            log.info("\n⏭️  Stopped at the first failure (--fail-fast)")
     
     # Print summary
-    print("\n" + "="*50)
-    print("TEST SUMMARY")
-    print("="*50)
+    log.info("\n" + "="*50)
+    log.info("TEST SUMMARY")
+    log.info("="*50)
     
     passed = 0
     failed = 0
     
     for test_name, result in test_results:
         status = "✅ PASSED" if result else "❌ FAILED"
-        print(f"{test_name}: {status}")
+        log.info(f"{test_name}: {status}")
         if result:
             passed += 1
         else:
             failed += 1
     
-    print(f"\nTotal: {passed + failed} tests")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
+    log.info(f"\nTotal: {passed + failed} tests")
+    log.info(f"Passed: {passed}")
+    log.info(f"Failed: {failed}")
     
     if failed == 0:
-        print("\n🎉 All tests passed! Backend is working correctly.")
+        log.info("\n🎉 All tests passed! Backend is working correctly.")
         return True
     else:
-        print(f"\n⚠️  {failed} test(s) failed. Check the output above for details.")
+        log.info(f"\n⚠️  {failed} test(s) failed. Check the output above for details.")
         return False
 
+def main():
+    parser = argparse.ArgumentParser(description="SUPERCHARGE backend API tests")
+    parser.add_argument('--thorough', action='store_true',
+                        help="also exercise login after signup")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="stop scheduling suites after the first failure")
+    args = parser.parse_args()
+    listener = setup_logging()
+    try:
+        # uvloop's libuv-based loop cuts per-request overhead when installed
+        run = uvloop.run if uvloop else asyncio.run
+        return run(amain(args))
+    finally:
+        listener.stop()
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file